@@ -11,7 +11,9 @@ from numpy.testing import assert_equal, assert_allclose
 from scipy.ndimage import shift
 
 import abel
-from abel.tools.center import find_origin, center_image, set_center
+from abel.tools.center import find_origin, center_image, set_center, \
+    axis_slices, find_origin_by_center_of_mass_batch, \
+    find_origin_by_convolution_batch, make_centerer, image_projections
 
 
 def test_find_origin():
@@ -38,6 +40,106 @@ def test_find_origin():
                                         'origin = {} not equal {}'.
                                         format(rows, cols, method, axes,
                                                origin, ref))
+            # precomputed projections must give the same results
+            proj = image_projections(data)
+            for method in ['com', 'convolution', 'gaussian']:
+                assert_equal(find_origin(data, method, axes, proj=proj),
+                             find_origin(data, method, axes),
+                             err_msg='-> {} x {}, method = {}, with proj'.
+                                     format(rows, cols, method))
+            # fast 'gaussian' is exact for gaussian data
+            origin = find_origin(data, 'gaussian', axes, fast=True)
+            assert_allclose(origin, ref, verbose=False,
+                            err_msg='-> {} x {}, method = gaussian, fast: '
+                                    'origin = {} not equal {}'.
+                                    format(rows, cols, origin, ref))
+
+
+def test_find_origin_gaussian_fast_edge():
+    """
+    Test fast 'gaussian' method with maxima at the image edges.
+    """
+    rng = np.random.RandomState(0)
+    for _ in range(100):
+        data = rng.random_sample((5, 5))
+        data[0] += 1  # (maximum at the top edge)
+        origin = find_origin(data, 'gaussian', fast=True)
+        assert 0 <= origin[0] <= 2 and 0 <= origin[1] <= 4, \
+            '-> origin = {} for\n{}'.format(origin, data)
+
+
+def test_find_origin_slice_empty():
+    """
+    Test 'slice' method with empty slice profiles.
+    """
+    for shape, radial_range in [((3, 3), (0, -1)), ((2, 6), (0, -1)),
+                                ((21, 21), (50, 60))]:
+        origin = find_origin(np.ones(shape), 'slice',
+                             radial_range=radial_range)
+        assert_allclose(origin, ((shape[0] - 1) / 2, (shape[1] - 1) / 2),
+                        err_msg='-> shape = {}, radial_range = {}'.
+                                format(shape, radial_range))
+
+
+def test_find_origin_convolution_int():
+    """
+    Test 'convolution' method with integer images (exact ties of maxima).
+    """
+    data = np.array([[2, 0, 2, 0, 2, 2, 0, 1]]).T
+    origin, conv, _ = find_origin(data, 'convolution', axes=0,
+                                  projections=True)
+    assert origin[0] == 2.0, '-> origin = {}'.format(origin)
+    assert_equal(conv, np.convolve(data[:, 0], data[:, 0]))
+    rng = np.random.RandomState(0)
+    IMs = rng.poisson(0.3, (1000, 8, 9))
+    ref = [[np.argmax(np.convolve(p, p)) / 2
+            for p in [data.sum(axis=1), data.sum(axis=0)]] for data in IMs]
+    for data, r in zip(IMs, ref):
+        origin = find_origin(data, 'convolution')
+        assert_equal(origin, r, err_msg='-> data =\n{}'.format(data))
+    assert_equal(find_origin_by_convolution_batch(IMs), ref,
+                 err_msg='-> batch')
+
+
+def test_find_origin_dtype():
+    """
+    Test find_origin methods with float32 images and explicit dtype.
+    """
+    rows, cols = 21, 20
+    row, col = 9.6, 10.3
+    w = 4.0  # gaussian width parameter (sqrt(2) * sigma)
+    data = np.exp(-(((np.arange(cols) - col) / w)**2 +
+                    ((np.arange(rows)[:, None] - row) / w)**2))
+    data32 = data.astype(np.float32)
+    for p in image_projections(data32)[:2]:
+        assert p.dtype == np.float32, '-> float32 projections'
+    for method in ['com', 'convolution', 'gaussian', 'slice']:
+        ref = find_origin(data, method)
+        for dtype in [None, np.float32, np.float64]:
+            origin = find_origin(data32, method, dtype=dtype)
+            assert_allclose(origin, ref, atol=1e-3,
+                            err_msg='-> method = {}, dtype = {}'.
+                                    format(method, dtype))
+
+
+def test_find_origin_batch():
+    """
+    Test batch versions of find_origin methods.
+    """
+    rows, cols = 12, 13
+    w = 3.0  # gaussian width parameter (sqrt(2) * sigma)
+    origins = [(5.4, 6.6), (6.0, 5.2), (4.7, 7.1)]
+    IMs = np.array([np.exp(-(((np.arange(cols) - col) / w)**2 +
+                             ((np.arange(rows)[:, None] - row) / w)**2))
+                    for row, col in origins])
+    for method, batch in [('com', find_origin_by_center_of_mass_batch),
+                          ('convolution', find_origin_by_convolution_batch)]:
+        for axes in [0, 1, (0, 1)]:
+            result = batch(IMs, axes=axes)
+            ref = [find_origin(IM, method, axes) for IM in IMs]
+            assert_allclose(result, ref,
+                            err_msg='-> method = {}, axes = {}'.
+                                    format(method, axes))
 
 
 def test_set_center_int():
@@ -106,6 +208,16 @@ def test_set_center_int():
                                          'must be =\n{}'.
                                          format(rows, cols, (row, col), crop,
                                                 result, ref))
+                    # float whole-pixel origin must give the same result
+                    forigin = tuple(None if x is None else float(x)
+                                    for x in (row, col))
+                    result = set_center(data, forigin, crop=crop, order=3)
+                    assert_equal(result, ref, verbose=False,
+                                 err_msg='-> {} x {}, origin = {}, crop = {}\n'
+                                         'result =\n{}\n'
+                                         'must be =\n{}'.
+                                         format(rows, cols, forigin, crop,
+                                                result, ref))
 
 
 def test_set_center_float():
@@ -249,6 +361,108 @@ def test_set_center_order():
                    [0.2, 1, 1, 1, 1, 0.8, 0])
     assert_allclose(result, ref,
                     err_msg='-> crop = maintain_data, order = 1')
+    # float32 data must be interpolated, not rounded
+    data32 = np.linspace(0, 1, 25, dtype=np.float32).reshape((5, 5))
+    for crop in ['maintain_size', 'valid_region', 'maintain_data']:
+        result = set_center(data32, (2.5, 2), crop, order=1)
+        ref = set_center(data32.astype(float), (2.5, 2), crop, order=1)
+        assert result.dtype == np.float32, \
+            '-> crop = {}, float32 order = 1: dtype {}'.format(crop,
+                                                               result.dtype)
+        assert_allclose(result, ref, rtol=1e-6,
+                        err_msg='-> crop = {}, float32, order = 1'.
+                                format(crop))
+
+
+def test_set_center_out():
+    """
+    Test output to a given array and in-place centering.
+    """
+    for rows, cols in itertools.product([5, 6], repeat=2):
+        data = np.arange(1.0, rows * cols + 1).reshape((rows, cols))
+        for origin, order in itertools.product(
+                [(0, 0), (4, 1), (2, 5), (None, 0), (3, None), (1.5, 3.2)],
+                [0, 1, 3]):
+            ref = set_center(data, origin, order=order)
+            msg = '-> {} x {}, origin = {}, order = {}, '.\
+                  format(rows, cols, origin, order)
+            out = np.full_like(data, np.nan)
+            result = set_center(data, origin, order=order, out=out)
+            assert result is out, msg + 'result is not out'
+            assert_allclose(out, ref, err_msg=msg + 'out')
+            inplace = data.copy()
+            set_center(inplace, origin, order=order, out=inplace)
+            assert_allclose(inplace, ref, err_msg=msg + 'in-place')
+
+
+def test_set_center_parallel():
+    """
+    Test that whole-pixel shifts copied by several threads give the same
+    results as copied serially.
+    """
+    center = abel.tools.center
+    rows, cols = 7, 6
+    data = np.arange(1.0, rows * cols + 1).reshape((rows, cols))
+    origins = list(itertools.product(range(-12, 11), range(-12, 10)))
+    refs = [set_center(data, origin) for origin in origins]
+    parallel_nbytes = center._parallel_nbytes
+    cpu_count = center.multiprocessing.cpu_count
+    try:
+        center._parallel_nbytes = 0
+        center.multiprocessing.cpu_count = lambda: 3
+        for origin, ref in zip(origins, refs):
+            assert_equal(set_center(data, origin), ref,
+                         err_msg='-> origin = {}'.format(origin))
+    finally:
+        center._parallel_nbytes = parallel_nbytes
+        center.multiprocessing.cpu_count = cpu_count
+
+
+def test_make_centerer():
+    """
+    Test that centerers reproduce set_center() results.
+    """
+    origins = [(2, 3), (None, 1), (-2, None), (1.0, 4.0), (2.2, 3),
+               (1.6, None), (30, -40), (-0.57, -9.0)]
+    for rows, cols in itertools.product([5, 6], repeat=2):
+        data = np.arange(1.0, rows * cols + 1).reshape((rows, cols))
+        for crop, order, axes in itertools.product(
+                ['maintain_size', 'valid_region', 'maintain_data'],
+                [0, 1, 3], [0, 1, (0, 1)]):
+            centerer = make_centerer((rows, cols), crop, axes, order)
+            for origin in origins:
+                assert_allclose(centerer(data, origin),
+                                set_center(data, origin, crop, axes, order),
+                                err_msg='-> {} x {}, origin = {}, crop = {}, '
+                                        'order = {}, axes = {}'.
+                                        format(rows, cols, origin, crop,
+                                               order, axes))
+
+
+def test_axis_slices():
+    """
+    Test slice profiles.
+    """
+    for rows, cols in itertools.product([10, 11], repeat=2):
+        data = np.random.RandomState(0).random_sample((rows, cols))
+        r2, c2 = rows // 2, cols // 2
+        for sw2 in [0, 1, 5]:
+            ref = (data[:r2, c2 - sw2:c2 + sw2 + 1].sum(axis=1)[::-1],
+                   data[r2 + rows % 2:, c2 - sw2:c2 + sw2 + 1].sum(axis=1),
+                   data[r2 - sw2:r2 + sw2 + 1, :c2].sum(axis=0)[::-1],
+                   data[r2 - sw2:r2 + sw2 + 1, c2 + cols % 2:].sum(axis=0))
+            for dtype in [float, np.float32, np.float16, '>f8',
+                          np.longdouble]:
+                rtol = 1e-2 if dtype is np.float16 else 1e-6
+                result = axis_slices(data.astype(dtype),
+                                     radial_range=(0, None),
+                                     slice_width=2 * sw2)
+                for name, res, r in zip(['top', 'bottom', 'left', 'right'],
+                                        result, ref):
+                    assert_allclose(res, r, rtol=rtol,
+                                    err_msg='-> {} x {}, sw2 = {}, {}, {}'.
+                                            format(rows, cols, sw2, dtype,
+                                                   name))
 
 
 def test_center_image():
@@ -295,11 +509,29 @@ def test_center_image():
 
     assert_allclose(IMy.shape, (m, n-1))
 
+    # check square output for all size combinations
+    for rows, cols in itertools.product(range(8, 12), repeat=2):
+        for odd_size in [False, True]:
+            IMs = center_image(np.ones((rows, cols)), method="image_center",
+                               odd_size=odd_size, square=True)
+            msg = '-> {} x {}, odd_size = {}'.format(rows, cols, odd_size)
+            assert IMs.shape[0] == IMs.shape[1], msg
+            assert not odd_size or IMs.shape[1] % 2, msg
+
 
 if __name__ == "__main__":
     test_find_origin()
+    test_find_origin_gaussian_fast_edge()
+    test_find_origin_slice_empty()
+    test_find_origin_convolution_int()
+    test_find_origin_dtype()
+    test_find_origin_batch()
     test_set_center_axes()
     test_set_center_int()
     test_set_center_float()
     test_set_center_order()
+    test_set_center_out()
+    test_set_center_parallel()
+    test_make_centerer()
+    test_axis_slices()
     test_center_image()
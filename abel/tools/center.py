@@ -6,14 +6,35 @@ from __future__ import unicode_literals
 
 import numpy as np
 from .math import fit_gaussian
+import multiprocessing
+import threading
 import warnings
-from scipy.ndimage import center_of_mass, shift
-from scipy.optimize import minimize
+try:
+    from functools import lru_cache
+except ImportError:  # no lru_cache in Python 2
+    def lru_cache(maxsize):
+        return lambda func: func
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # no concurrent.futures in Python 2
+    ThreadPoolExecutor = None
+from scipy.ndimage import shift
 # testing strings with Python 2 and 3 compatibility
 from six import string_types
 
 from abel import _deprecated, _deprecate
 
+# per-thread scratch storage (see _pad1())
+_scratch = threading.local()
+
+# images larger than this (in bytes) are copied by several threads,
+# but not more than this number (enough to saturate the memory bandwidth)
+_parallel_nbytes = 32 * 1024**2
+_parallel_threads = 4
+
+# whole axis, for indexing
+_ALL = slice(None)
+
 
 def find_origin(IM, method='image_center', axes=(0, 1), verbose=False,
                 **kwargs):
@@ -47,6 +68,11 @@ def find_origin(IM, method='image_center', axes=(0, 1), verbose=False,
         find origin coordinates: ``0`` (vertical), or ``1`` (horizontal), or
         ``(0, 1)`` (both vertical and horizontal).
 
+    kwargs : dict
+        additional keyword arguments passed to the function implementing the
+        method. For example, projections precomputed by
+        :func:`image_projections` can be reused as ``proj=...``.
+
     Returns
     -------
     out : (float, float)
@@ -134,32 +160,34 @@ def center_image(IM, method='com', odd_size=True, square=False, axes=(0, 1),
                    'argument "center" is deprecated, use "method" instead.')
         method = center
 
-    rows, cols = IM.shape
+    # bounds of the used image region, IM[r0:r1, c0:c1]
+    r0, c0 = 0, 0
+    r1, c1 = IM.shape
 
-    if odd_size and cols % 2 == 0:
+    if odd_size and c1 % 2 == 0:
         # drop rightside column
-        IM = IM[:, :-1]
-        rows, cols = IM.shape
+        c1 -= 1
 
-    if square and rows != cols:
+    if square and r1 != c1:
         # make rows == cols, but maintain approx. center
-        if rows > cols:
-            diff = rows - cols
+        if r1 > c1:
+            diff = r1 - c1
             trim = diff // 2
-            if trim > 0:
-                IM = IM[trim: -trim]  # remove even number of rows off each end
+            # remove even number of rows off each end
+            r0 += trim
+            r1 -= trim
             if diff % 2:
-                IM = IM[: -1]  # remove one additional row
+                r1 -= 1  # remove one additional row
 
         else:
             # make rows == cols, check row oddness
-            if odd_size and rows % 2 == 0:
-                IM = IM[:-1, :]
-                rows -= 1
-            xs = (cols - rows) // 2
-            IM = IM[:, xs:-xs]
+            if odd_size and r1 % 2 == 0:
+                r1 -= 1
+            c0 += (c1 - r1) // 2
+            c1 = c0 + r1  # (also removes one additional column)
 
-        rows, cols = IM.shape
+    # single (contiguous) copy of the used region, if it is not the whole image
+    IM = np.ascontiguousarray(IM[r0:r1, c0:c1])
 
     # origin is in (row, column) format!
     if isinstance(method, string_types):
@@ -174,7 +202,7 @@ def center_image(IM, method='com', odd_size=True, square=False, axes=(0, 1),
 
 
 def set_center(data, origin, crop='maintain_size', axes=(0, 1), order=3,
-               verbose=False, center=_deprecated):
+               verbose=False, center=_deprecated, out=None):
     """
     Move image origin to mid-point of image (``rows // 2, cols // 2``).
 
@@ -220,6 +248,12 @@ def set_center(data, origin, crop='maintain_size', axes=(0, 1), order=3,
     verbose : bool
         print some information for debugging
 
+    out : 2D np.array, optional
+        array of the same shape and dtype as **data**, to which the result is
+        written (only for **crop** = ``'maintain_size'``). It can be **data**
+        itself for in-place centering, which for whole-pixel shifts does not
+        need any additional memory.
+
     Returns
     -------
     out : 2D np.array
@@ -243,8 +277,8 @@ def set_center(data, origin, crop='maintain_size', axes=(0, 1), order=3,
     if isinstance(axes, int):
         axes = [axes]
     axes = set(axes)
-    origin = np.array(origin, dtype=object)  # (for None, int or float)
-    subpixel = np.zeros(2)
+    origin = list(origin)  # (for None, int or float)
+    subpixel = [0, 0]
     origin_ = [None, None]
     for a in [0, 1]:
         if origin[a] is None:
@@ -263,7 +297,8 @@ def set_center(data, origin, crop='maintain_size', axes=(0, 1), order=3,
             # complement (from the other edge)
             origin_[a] = shape[a] - 1 - origin[a]
     # don't interpolate for whole-pixels shifts
-    if np.all(subpixel == 0):
+    # (all crop options then use only slicing and padding, without shift())
+    if not any(subpixel):
         order = 0
     if verbose:
         print('Centering axes', tuple(axes), 'using order', order)
@@ -272,27 +307,29 @@ def set_center(data, origin, crop='maintain_size', axes=(0, 1), order=3,
     # pixels, so we wrap it with padding and cropping. Once this behavior is
     # corrected, our code can be cleaned up.
 
+    if out is not None:
+        if crop != 'maintain_size':
+            raise ValueError('Argument "out" can be used only with '
+                             'crop="maintain_size".')
+        if out.shape != shape or out.dtype != data.dtype:
+            raise ValueError('Argument "out" must have the same shape and '
+                             'dtype as "data".')
+
     if crop == 'maintain_size':
         delta = [0, 0]
         if order:  # fractional shift
             for a in axes:
                 if origin[a] is not None:
                     delta[a] = center[a] - (origin[a] + subpixel[a])
-            out = shift(np.pad(data, 1, 'constant'),
-                        delta, order=order)[1:-1, 1:-1]  # (see note above)
+            res = _shift(_pad1(data), delta, order)[1:-1, 1:-1]  # (see note)
+            if out is None:
+                out = res
+            else:
+                out[...] = res
         else:  # whole-pixel shift
-            src = [slice(None), slice(None)]  # for the source region
-            dst = [slice(None), slice(None)]  # for the destination region
             for a in axes:
                 delta[a] = center[a] - origin[a]
-                # gaps for positive and negative shifts wrt edges
-                dpos = max(0, delta[a])
-                dneg = max(0, -delta[a])
-                # corresponding regions
-                src[a] = slice(dneg, shape[a] - dpos)
-                dst[a] = slice(dpos, shape[a] - dneg)
-            out = np.zeros_like(data)
-            out[tuple(dst)] = data[tuple(src)]
+            out = _shift_whole(data, delta, out)
         if verbose:
             print('Shifted by', tuple(delta))
             print('Output shape', out.shape,
@@ -302,12 +339,11 @@ def set_center(data, origin, crop='maintain_size', axes=(0, 1), order=3,
     # size will change to add/remove the shifted fractional pixel parts
     if order:
         if verbose:
-            print('Subpixel shift by', tuple(-subpixel))
+            print('Subpixel shift by', tuple(-s for s in subpixel))
         # (see the note above about padding on both sides and cropping)
-        data = shift(np.pad(data, 1, 'constant'),
-                     -subpixel, order=order)[:-1, :-1]
+        data = _shift(_pad1(data), [-s for s in subpixel], order)[:-1, :-1]
         # shift origin or cut unused pixels
-        cut = [slice(None), slice(None)]
+        cut = [_ALL, _ALL]
         for a in [0, 1]:
             if subpixel[a]:
                 if crop == 'valid_region':
@@ -320,7 +356,7 @@ def set_center(data, origin, crop='maintain_size', axes=(0, 1), order=3,
                 cut[a] = slice(1, None)  # cut empty (not shifted) pixel
         data = data[tuple(cut)]
     if crop == 'valid_region':
-        src = [slice(None), slice(None)]
+        src = [_ALL, _ALL]
         for a in axes:
             # distance to the closest edge
             d = min(origin[a], origin_[a])
@@ -347,8 +383,207 @@ def set_center(data, origin, crop='maintain_size', axes=(0, 1), order=3,
         raise ValueError('Invalid crop option "{}".'.format(crop))
 
 
+def _shift(data, delta, order):
+    """
+    Shift 2D array by **delta** = (rows, cols) with zero filling, using
+    interpolation of the given **order** (1–5). Linear interpolation
+    (**order** = 1) is done directly, without the scipy.ndimage spline
+    machinery; higher orders use :func:`scipy.ndimage.shift`.
+    """
+    if order > 1:
+        return shift(data, delta, order=order, mode='constant', cval=0.0,
+                     prefilter=True)
+
+    # floating-point working type (float64 for integers, as in scipy)
+    dtype = np.result_type(data.dtype, np.float32) \
+        if data.dtype.kind == 'f' else np.float64
+    out = data
+    for a in [0, 1]:
+        if delta[a] == 0:
+            continue
+        n = out.shape[a]
+        # out[i] = (1 - f) * in[i - k] + f * in[i - (k + 1)]
+        k = int(np.floor(delta[a]))
+        f = delta[a] - k
+        res = np.zeros(out.shape, dtype=dtype)
+        for d, w in [(k, 1 - f), (k + 1, f)]:
+            if w == 0 or abs(d) >= n:
+                continue
+            src, dst = _shift_slices(d, n)
+            if a == 0:
+                res[dst] += w * out[src]
+            else:
+                res[:, dst] += w * out[:, src]
+        out = res
+    if out is data:  # (always return a new array, as shift() does)
+        out = data.copy()
+    elif data.dtype.kind in 'iub':  # (integer input, round as scipy does)
+        out = np.rint(out).astype(data.dtype)
+    elif out.dtype != data.dtype:
+        out = out.astype(data.dtype)
+    return out
+
+
+def _shift_slices(d, n):
+    """
+    Source and destination slices for shifting **n** elements by **d**
+    (whole) positions, discarding elements shifted beyond the edges.
+    """
+    # gaps for positive and negative shifts wrt edges
+    dpos = min(max(0, d), n)
+    dneg = min(max(0, -d), n)
+    # corresponding regions
+    return slice(dneg, n - dpos), slice(dpos, n - dneg)
+
+
+def _shift_whole(data, delta, out=None):
+    """
+    Shift 2D array by whole pixels **delta** = (rows, cols) with zero filling.
+    The result is written to **out** (if given), which can be **data** itself.
+    """
+    rsrc, rdst = _shift_slices(delta[0], data.shape[0])
+    csrc, cdst = _shift_slices(delta[1], data.shape[1])
+    if out is None:
+        out = np.empty_like(data)
+    nrows = rdst.stop - rdst.start
+    nthreads = 1
+    if data.nbytes > _parallel_nbytes and ThreadPoolExecutor is not None:
+        nthreads = min(multiprocessing.cpu_count(), _parallel_threads, nrows)
+    if np.may_share_memory(out, data):
+        # in-place: copy by blocks of rows, starting from the side towards
+        # which the data is moved, so that sources are read before being
+        # overwritten (only rows for vertical shifts do not overlap)
+        d = rdst.start - rsrc.start
+        step = abs(d) or 1
+        starts = range(0, nrows, step)
+        if d > 0:
+            starts = reversed(starts)
+        for i0 in starts:
+            i1 = min(i0 + step, nrows)
+            out[rdst.start + i0:rdst.start + i1, cdst] = \
+                data[rsrc.start + i0:rsrc.start + i1, csrc]
+    elif nthreads > 1:
+        # copy in horizontal bands; NumPy releases the GIL while copying,
+        # so several threads can better use the memory bandwidth
+        bounds = np.linspace(0, nrows, nthreads + 1, dtype=int)
+
+        def copy_band(i0, i1):
+            out[rdst.start + i0:rdst.start + i1, cdst] = \
+                data[rsrc.start + i0:rsrc.start + i1, csrc]
+
+        with ThreadPoolExecutor(nthreads) as executor:
+            list(executor.map(copy_band, bounds[:-1], bounds[1:]))
+    else:
+        out[rdst, cdst] = data[rsrc, csrc]
+    # fill with zeros only the edges not covered by the copy
+    out[:rdst.start] = 0
+    out[rdst.stop:] = 0
+    out[rdst, :cdst.start] = 0
+    out[rdst, cdst.stop:] = 0
+    return out
+
+
+def _pad1(data):
+    """
+    Same as ``np.pad(data, 1, 'constant')``, but reusing a per-thread scratch
+    buffer from the previous call with the same shape and dtype, thus without
+    allocations in repeated calls. The result is valid only until the next
+    call (in the same thread) and must not be modified.
+    """
+    shape = (data.shape[0] + 2, data.shape[1] + 2)
+    buf = getattr(_scratch, 'pad1', None)
+    if buf is None or buf.shape != shape or buf.dtype != data.dtype:
+        buf = _scratch.pad1 = np.zeros(shape, dtype=data.dtype)
+    buf[1:-1, 1:-1] = data  # (border stays zero)
+    return buf
+
+
+def make_centerer(shape, crop='maintain_size', axes=(0, 1), order=3):
+    """
+    Create a function for centering images of a fixed shape with fixed
+    options, for repeated use (for example, with a series of frames).
+
+    Parameters
+    ----------
+    shape : tuple of int
+        (rows, cols) shape of the images
+
+    crop, axes, order :
+        see :func:`set_center`
+
+    Returns
+    -------
+    centerer : function
+        ``centerer(data, origin)`` returns the same result as
+        ``set_center(data, origin, crop, axes, order)``, but the options are
+        processed only once, and whole-pixel shifts with
+        **crop** = ``'maintain_size'`` are done directly. Functions for the
+        last 32 distinct argument sets are cached.
+    """
+    if isinstance(axes, int):
+        axes = [axes]
+    return _make_centerer(tuple(shape), crop, tuple(sorted(set(axes))),
+                          order)
+
+
+@lru_cache(maxsize=32)
+def _make_centerer(shape, crop, axes, order):
+    """ Cached worker for :func:`make_centerer`. """
+    if crop not in ['maintain_size', 'valid_region', 'maintain_data']:
+        raise ValueError('Invalid crop option "{}".'.format(crop))
+    center = (shape[0] // 2, shape[1] // 2)
+
+    def centerer(data, origin):
+        if data.shape != shape:
+            raise ValueError('Image shape {} does not match {}.'.
+                             format(data.shape, shape))
+        if crop == 'maintain_size':
+            # to absolute coordinates
+            absolute = [None if o is None else o + shape[a] if o < 0 else o
+                        for a, o in enumerate(origin)]
+            # (set_center() interpolates if any coordinate is fractional)
+            if not order or all(o is None or o == int(o) for o in absolute):
+                delta = [0, 0]
+                for a in axes:
+                    if absolute[a] is not None:
+                        delta[a] = center[a] - int(round(absolute[a]))
+                return _shift_whole(data, delta)
+        return set_center(data, origin, crop, axes, order)
+
+    return centerer
+
+
+def image_projections(IM, dtype=None):
+    """
+    Calculate image projections used by several :func:`find_origin` methods
+    (``com``, ``convolution`` and ``gaussian``). They can be passed to these
+    methods as the **proj** argument to avoid repeated calculations.
+
+    Parameters
+    ----------
+    IM : numpy 2D array
+        image data
+
+    dtype : data-type, optional
+        data type for summing the image into projections. By default, as in
+        :func:`numpy.sum`, floating-point images keep their precision (so
+        float32 images are processed faster), and integer images are summed
+        with a wider integer type.
+
+    Returns
+    -------
+    proj : tuple of (1D np.array, 1D np.array, float)
+        sums over each row and over each column (that is, projections onto
+        axes 0 and 1) and the total sum
+    """
+    rsum = IM.sum(axis=1, dtype=dtype)
+    csum = IM.sum(axis=0, dtype=dtype)
+    return rsum, csum, rsum.sum()
+
+
 def find_origin_by_center_of_mass(IM, axes=(0, 1), verbose=False,
-                                  round_output=False, **kwargs):
+                                  round_output=False, proj=None, dtype=None,
+                                  **kwargs):
     """
     Find image origin by calculating its center of mass.
 
@@ -365,12 +600,27 @@ def find_origin_by_center_of_mass(IM, axes=(0, 1), verbose=False,
         if ``True``, the coordinates are rounded to integers;
         otherwise they are floats.
 
+    proj : tuple of np.arrays, optional
+        image projections precomputed by :func:`image_projections`, to avoid
+        recalculating them when several methods are applied to the same image.
+
+    dtype : data-type, optional
+        data type for summing the image into projections. By default, as in
+        :func:`numpy.sum`, floating-point images keep their precision (so
+        float32 images are processed faster), and integer images are summed
+        with a wider integer type.
+
     Returns
     -------
     origin : (float, float)
         (row, column)
     """
-    origin = list(center_of_mass(IM))
+    # (from projections, faster than scipy.ndimage.center_of_mass())
+    if proj is None:
+        proj = image_projections(IM, dtype)
+    rsum, csum, total = proj
+    origin = [np.einsum('i,i->', np.arange(IM.shape[0]), rsum) / total,
+              np.einsum('j,j->', np.arange(IM.shape[1]), csum) / total]
 
     # reset unneeded coordinates
     if isinstance(axes, int):
@@ -393,7 +643,30 @@ def find_origin_by_center_of_mass(IM, axes=(0, 1), verbose=False,
     return origin
 
 
-def find_origin_by_convolution(IM, axes=(0, 1), projections=False, **kwargs):
+def _fftconvolve(a, b):
+    """
+    Full linear convolution of real 1D arrays (or of 2D arrays row by row)
+    computed by FFT, as ``scipy.signal.fftconvolve(a, b, axes=-1)``.
+    """
+    n = a.shape[-1] + b.shape[-1] - 1
+    return np.fft.irfft(np.fft.rfft(a, n) * np.fft.rfft(b, n), n)
+
+
+def _autoconvolve(p):
+    """
+    Autoconvolution of 1D array (or of 2D array row by row) by FFT, as
+    ``np.convolve(p, p)``. For integer **p**, the result is rounded back to
+    exact integers, so that equal maxima are not distinguished by the FFT
+    rounding errors.
+    """
+    conv = _fftconvolve(p, p)
+    if p.dtype.kind in 'iu':
+        conv = np.rint(conv).astype(p.dtype)
+    return conv
+
+
+def find_origin_by_convolution(IM, axes=(0, 1), projections=False, proj=None,
+                               dtype=None, **kwargs):
     """
     Find the image origin as the maximum of autoconvolution of its projections
     along each axis.
@@ -413,6 +686,16 @@ def find_origin_by_convolution(IM, axes=(0, 1), projections=False, **kwargs):
         find origin coordinates: ``0`` (vertical), or ``1`` (horizontal), or
         ``(0, 1)`` (both vertical and horizontal).
 
+    proj : tuple of np.arrays, optional
+        image projections precomputed by :func:`image_projections`, to avoid
+        recalculating them when several methods are applied to the same image.
+
+    dtype : data-type, optional
+        data type for summing the image into projections. By default, as in
+        :func:`numpy.sum`, floating-point images keep their precision (so
+        float32 images are processed faster), and integer images are summed
+        with a wider integer type.
+
     Returns
     -------
     origin : (float, float)
@@ -427,9 +710,9 @@ def find_origin_by_convolution(IM, axes=(0, 1), projections=False, **kwargs):
     origin = [IM.shape[0] // 2, IM.shape[1] // 2]
     for a in axes:
         # projection along the other axis
-        proj = IM.sum(axis=1 - a)
-        # autoconvolute projections
-        conv[a] = np.convolve(proj, proj, mode='full')
+        p = IM.sum(axis=1 - a, dtype=dtype) if proj is None else proj[a]
+        # autoconvolute projections (using FFT, O(N log N))
+        conv[a] = _autoconvolve(p)
         # take the first max, should there be several equal maxima
         origin[a] = np.argmax(conv[a]) / 2
     origin = tuple(origin)
@@ -440,6 +723,93 @@ def find_origin_by_convolution(IM, axes=(0, 1), projections=False, **kwargs):
         return origin
 
 
+def find_origin_by_center_of_mass_batch(IMs, axes=(0, 1), dtype=None,
+                                        **kwargs):
+    """
+    Find origins of a stack of images by calculating their centers of mass,
+    as :func:`find_origin_by_center_of_mass`, but vectorized over the stack.
+
+    Parameters
+    ----------
+    IMs : numpy 3D array
+        stack of images, shape (N, rows, cols)
+
+    axes : int or tuple
+        find origin coordinates: ``0`` (vertical), or ``1`` (horizontal), or
+        ``(0, 1)`` (both vertical and horizontal).
+
+    dtype : data-type, optional
+        data type for summing the image into projections. By default, as in
+        :func:`numpy.sum`, floating-point images keep their precision (so
+        float32 images are processed faster), and integer images are summed
+        with a wider integer type.
+
+    Returns
+    -------
+    origins : numpy 2D array
+        (row, column) origins of each image, shape (N, 2)
+    """
+    if isinstance(axes, int):
+        axes = [axes]
+
+    N, rows, cols = IMs.shape
+    rsum = IMs.sum(axis=2, dtype=dtype)
+    csum = IMs.sum(axis=1, dtype=dtype)
+    total = rsum.sum(axis=1)
+    origins = np.empty((N, 2))
+    origins[:] = (rows // 2, cols // 2)
+    if 0 in axes:
+        origins[:, 0] = rsum.dot(np.arange(rows)) / total
+    if 1 in axes:
+        origins[:, 1] = csum.dot(np.arange(cols)) / total
+
+    return origins
+
+
+def find_origin_by_convolution_batch(IMs, axes=(0, 1), dtype=None,
+                                     **kwargs):
+    """
+    Find origins of a stack of images as the maxima of autoconvolution of
+    their projections, as :func:`find_origin_by_convolution`, but with all
+    autoconvolutions computed together.
+
+    Parameters
+    ----------
+    IMs : numpy 3D array
+        stack of images, shape (N, rows, cols)
+
+    axes : int or tuple
+        find origin coordinates: ``0`` (vertical), or ``1`` (horizontal), or
+        ``(0, 1)`` (both vertical and horizontal).
+
+    dtype : data-type, optional
+        data type for summing the image into projections. By default, as in
+        :func:`numpy.sum`, floating-point images keep their precision (so
+        float32 images are processed faster), and integer images are summed
+        with a wider integer type.
+
+    Returns
+    -------
+    origins : numpy 2D array
+        (row, column) origins of each image, shape (N, 2)
+    """
+    if isinstance(axes, int):
+        axes = [axes]
+
+    N, rows, cols = IMs.shape
+    origins = np.empty((N, 2))
+    origins[:] = (rows // 2, cols // 2)
+    for a in axes:
+        # projections along the other axis
+        proj = IMs.sum(axis=2 - a, dtype=dtype)
+        # autoconvolute all projections at once
+        conv = _autoconvolve(proj)
+        # take the first max, should there be several equal maxima
+        origins[:, a] = np.argmax(conv, axis=1) / 2
+
+    return origins
+
+
 def find_origin_by_center_of_image(IM, axes=(0, 1), verbose=False, **kwargs):
     """
     Find image origin simply as its center, from its dimensions.
@@ -462,7 +832,8 @@ def find_origin_by_center_of_image(IM, axes=(0, 1), verbose=False, **kwargs):
 
 
 def find_origin_by_gaussian_fit(IM, axes=(0, 1), verbose=False,
-                                round_output=False, **kwargs):
+                                round_output=False, fast=False, proj=None,
+                                dtype=None, **kwargs):
     """
     Find image origin by fitting the summation along rows and columns of the
     data to two 1D Gaussian functions.
@@ -480,6 +851,22 @@ def find_origin_by_gaussian_fit(IM, axes=(0, 1), verbose=False,
         if ``True``, the coordinates are rounded to integers;
         otherwise they are floats.
 
+    fast : bool
+        if ``True``, instead of the least-squares fit, the Gaussian center is
+        found from the projection maximum and its two neighbors (exact for
+        a noiseless Gaussian). This is much faster, but less robust for noisy
+        or irregular data.
+
+    proj : tuple of np.arrays, optional
+        image projections precomputed by :func:`image_projections`, to avoid
+        recalculating them when several methods are applied to the same image.
+
+    dtype : data-type, optional
+        data type for summing the image into projections. By default, as in
+        :func:`numpy.sum`, floating-point images keep their precision (so
+        float32 images are processed faster), and integer images are summed
+        with a wider integer type.
+
     Returns
     -------
     origin : (float, float)
@@ -491,9 +878,12 @@ def find_origin_by_gaussian_fit(IM, axes=(0, 1), verbose=False,
     origin = [IM.shape[0] // 2, IM.shape[1] // 2]
     for a in axes:
         # sum along the other axis
-        proj = np.sum(IM, axis=1 - a)
+        p = np.sum(IM, axis=1 - a, dtype=dtype) if proj is None else proj[a]
         # find gaussian center
-        origin[a] = fit_gaussian(proj)[1]
+        if fast:
+            origin[a] = _gaussian_peak(p)
+        else:
+            origin[a] = fit_gaussian(p)[1]
     origin = tuple(origin)
 
     if verbose:
@@ -510,7 +900,28 @@ def find_origin_by_gaussian_fit(IM, axes=(0, 1), verbose=False,
     return origin
 
 
-def axis_slices(IM, radial_range=(0, -1), slice_width=10):
+def _gaussian_peak(y):
+    """
+    Position of the maximum of 1D data from parabolic interpolation of the
+    logarithm of its 3 points around the maximal element (or of these points
+    themselves, if not all positive). If the parabola has no maximum, the
+    position of the maximal element is returned, and the interpolated one is
+    limited to ±1 from the middle of these points.
+    """
+    imax = np.argmax(y)
+    if y.shape[0] < 3:
+        return float(imax)
+    i = min(max(imax, 1), y.shape[0] - 2)
+    p = y[i - 1:i + 2].astype(float)
+    if np.all(p > 0):
+        p = np.log(p)
+    d = p[0] - 2 * p[1] + p[2]
+    if d >= 0:
+        return float(imax)
+    return float(i + min(max((p[0] - p[2]) / (2 * d), -1), 1))
+
+
+def axis_slices(IM, radial_range=(0, -1), slice_width=10, dtype=None):
     """
     Returns vertical and horizontal slice profiles, summed across slice_width.
 
@@ -525,6 +936,12 @@ def axis_slices(IM, radial_range=(0, -1), slice_width=10):
     slice_width : int
         width of the image slice, default 10 pixels
 
+    dtype : data-type, optional
+        data type for summing the image across the slices. By default, as in
+        :func:`numpy.sum`, floating-point images keep their precision (so
+        float32 images are processed faster), and integer images are summed
+        with a wider integer type.
+
     Returns
     -------
     top, bottom, left, right : 1D np.arrays shape (rmin:rmax, 1)
@@ -539,19 +956,55 @@ def axis_slices(IM, radial_range=(0, -1), slice_width=10):
     rmin, rmax = radial_range
 
     # vertical slice
-    top = IM[:r2, c2-sw2:c2+sw2+1].sum(axis=1)
-    bottom = IM[r2 + rows % 2:, c2-sw2:c2+sw2+1].sum(axis=1)
+    top = IM[:r2, c2-sw2:c2+sw2+1].sum(axis=1, dtype=dtype)
+    bottom = IM[r2 + rows % 2:, c2-sw2:c2+sw2+1].sum(axis=1, dtype=dtype)
 
     # horizontal slice
-    left = IM[r2-sw2:r2+sw2+1, :c2].sum(axis=0)
-    right = IM[r2-sw2:r2+sw2+1, c2 + cols % 2:].sum(axis=0)
+    left = IM[r2-sw2:r2+sw2+1, :c2].sum(axis=0, dtype=dtype)
+    right = IM[r2-sw2:r2+sw2+1, c2 + cols % 2:].sum(axis=0, dtype=dtype)
+
+    # (reversed slices are copied for contiguous access in further processing)
+    return (np.ascontiguousarray(top[::-1][rmin:rmax]), bottom[rmin:rmax],
+            np.ascontiguousarray(left[::-1][rmin:rmax]), right[rmin:rmax])
 
-    return (top[::-1][rmin:rmax], bottom[rmin:rmax],
-            left[::-1][rmin:rmax], right[rmin:rmax])
+
+def _align_offset(sliceA, sliceB, max_offset):
+    """
+    Offset (within ±**max_offset**) that minimizes the intensity difference
+    between an axial slice and its shifted opposite, that is, the sum of
+    squares of ``sliceA[i] - sliceB[i + offset]`` (with zeros beyond the
+    edges).
+
+    The sums for all integer offsets are obtained at once from the
+    cross-correlation (by FFT) and cumulative sums of squares, and the
+    subpixel offset from parabolic interpolation around their minimum.
+    """
+    sliceA = np.asarray(sliceA, dtype=float)
+    sliceB = np.asarray(sliceB, dtype=float)
+    n = sliceA.shape[0]
+    if n == 0:  # (nothing to compare)
+        return 0.0
+    m = min(max_offset, n - 1)
+    offsets = np.arange(-m, m + 1)
+    # sum(sliceA[i] * sliceB[i + offset]) for all offsets
+    corr = _fftconvolve(sliceB, sliceA[::-1])[n - 1 - m:n + m]
+    # sums of squares from each element to the end
+    sqA = np.cumsum(sliceA[::-1]**2)[::-1]
+    sqB = np.cumsum(sliceB[::-1]**2)[::-1]
+    # sum of squared differences, only overlapping parts of shifted slices
+    ssd = np.where(offsets < 0, sqA[abs(offsets)] + sqB[0],
+                   sqA[0] + sqB[abs(offsets)]) - 2 * corr
+    k = np.argmin(ssd)
+    offset = float(offsets[k])
+    if 0 < k < 2 * m:
+        d = ssd[k - 1] - 2 * ssd[k] + ssd[k + 1]
+        if d > 0:
+            offset += (ssd[k - 1] - ssd[k + 1]) / (2 * d)
+    return offset
 
 
 def find_origin_by_slice(IM, axes=(0, 1), slice_width=10, radial_range=(0, -1),
-                         axis=_deprecated, **kwargs):
+                         axis=_deprecated, dtype=None, **kwargs):
     """
     Find the image origin by comparing opposite sides.
 
@@ -571,6 +1024,12 @@ def find_origin_by_slice(IM, axes=(0, 1), slice_width=10, radial_range=(0, -1),
         find origin coordinates: ``0`` (vertical), or ``1`` (horizontal), or
         ``(0, 1)`` (both vertical and horizontal).
 
+    dtype : data-type, optional
+        data type for summing the image across the slices. By default, as in
+        :func:`numpy.sum`, floating-point images keep their precision (so
+        float32 images are processed faster), and integer images are summed
+        with a wider integer type.
+
     Returns
     -------
     origin : (float, float)
@@ -582,18 +1041,6 @@ def find_origin_by_slice(IM, axes=(0, 1), slice_width=10, radial_range=(0, -1),
                    'argument "axis" is deprecated, use "axes" instead.')
         axes = axis
 
-    def _align(offset, sliceA, sliceB):
-        """
-        Intensity difference between an axial slice and its shifted opposite.
-        """
-        # always shift to the left (towards center)
-        if offset < 0:
-            diff = shift(sliceA, offset) - sliceB
-        else:
-            diff = sliceA - shift(sliceB, -offset)
-        fvec = (diff**2).sum()
-        return fvec
-
     if isinstance(axes, int):
         axes = [axes]
 
@@ -601,30 +1048,20 @@ def find_origin_by_slice(IM, axes=(0, 1), slice_width=10, radial_range=(0, -1),
 
     r2 = (rows - 1) / 2
     c2 = (cols - 1) / 2
-    top, bottom, left, right = axis_slices(IM, radial_range, slice_width)
+    top, bottom, left, right = axis_slices(IM, radial_range, slice_width,
+                                           dtype)
 
     xyoffset = [0.0, 0.0]
     # determine shift to align both slices
-    # limit shift to +- 20 pixels
-    initial_shift = [0.1, ]
+    # limit shift to +- 50 pixels
 
     # vertical axis
     if 0 in axes:
-        fit = minimize(_align, initial_shift, args=(top, bottom),
-                       bounds=((-50, 50), ), tol=0.1)
-        if fit["success"]:
-            xyoffset[0] = -fit['x'][0] / 2  # x1/2 for image shift
-        else:
-            raise RuntimeError("fit failure: axis 0, zero shift set", fit)
+        xyoffset[0] = -_align_offset(top, bottom, 50) / 2  # x1/2 for image
 
     # horizontal axis
     if 1 in axes:
-        fit = minimize(_align, initial_shift, args=(left, right),
-                       bounds=((-50, 50), ), tol=0.1)
-        if fit["success"]:
-            xyoffset[1] = -fit['x'][0] / 2  # x1/2 for image shift
-        else:
-            raise RuntimeError("fit failure: axis 1, zero shift set", fit)
+        xyoffset[1] = -_align_offset(left, right, 50) / 2  # x1/2 for image
 
     # this is the (row, col) shift to align the slice profiles
     return r2 - xyoffset[0], c2 - xyoffset[1]